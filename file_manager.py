@@ -7,6 +7,7 @@ Uses only standard library modules.
 """
 
 import os 
+import stat
 import sys
 
 
@@ -33,18 +34,20 @@ def calculate_file_size():
         return
     
     try:
-        # Check if file exists
-        if not os.path.exists(filename):
+        # Look the file up once and reuse the result for every check
+        try:
+            file_stat = os.stat(filename)
+        except (OSError, ValueError):
             print(f"Error: File '{filename}' not found.")
             return
         
         # Check if it's a file (not a directory)
-        if not os.path.isfile(filename):
+        if not stat.S_ISREG(file_stat.st_mode):
             print(f"Error: '{filename}' is not a regular file.")
             return
         
         # Get file size in bytes
-        size_bytes = os.path.getsize(filename)
+        size_bytes = file_stat.st_size
         
         # Calculate size in different units
         # TODO: Fix the code below to perform floating point division
@@ -61,8 +64,6 @@ def calculate_file_size():
         if size_bytes >= 1024 * 1024:
             print(f"Size: {size_mb:.2f} MB")
             
-    except OSError as e:
-        print(f"Error reading file: {e}")
     except Exception as e:
         print(f"Unexpected error: {e}")
 
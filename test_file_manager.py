@@ -9,24 +9,86 @@ import unittest
 import sys
 import os
 import io
-from contextlib import redirect_stdout, redirect_stderr
+import shutil
+import tempfile
 from unittest.mock import patch
 
 # Import the file_manager module
 import file_manager
 
+# 1536 bytes (1.5 KB), so integer and floating point division print differently
+TEST_FILE_CONTENT = b"A" * 1536
+
+
+def capture_output(func, *args, **kwargs):
+    """Call func and return a (result, captured stdout) tuple."""
+    buffer = io.StringIO()
+    saved_stdout = sys.stdout
+    sys.stdout = buffer
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        sys.stdout = saved_stdout
+    return result, buffer.getvalue()
+
 
 class TestFileManagerTODOTasks(unittest.TestCase):
     """Test cases specifically for TODO tasks in file_manager."""
     
+    # Temporary directory holding the shared test file, or None if no test
+    # has needed it yet
+    tmpdir = None
+    
+    # Captured welcome message, or None if no test has needed it yet
+    welcome_output = None
+    
+    @classmethod
+    def setUpClass(cls):
+        """Patch input() for the whole class."""
+        cls.input_patcher = patch('builtins.input')
+        cls.mock_input = cls.input_patcher.start()
+        cls.addClassCleanup(cls.input_patcher.stop)
+    
+    def setUp(self):
+        """Clear any input() behaviour configured by a previous test."""
+        self.mock_input.reset_mock(return_value=True, side_effect=True)
+    
+    @classmethod
+    def get_test_filename(cls):
+        """Return the 1536 byte (1.5 KB) test file, creating it on first use."""
+        if cls.tmpdir is None:
+            cls.tmpdir = tempfile.mkdtemp()
+            cls.test_filename = os.path.join(cls.tmpdir, "test.txt")
+            fd = os.open(cls.test_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, TEST_FILE_CONTENT)
+            finally:
+                os.close(fd)
+        return cls.test_filename
+    
+    @classmethod
+    def get_welcome_output(cls):
+        """Return the output of display_welcome, capturing it on first use."""
+        if cls.welcome_output is None:
+            _, cls.welcome_output = capture_output(file_manager.display_welcome)
+        return cls.welcome_output
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory if one was created."""
+        if cls.tmpdir is not None:
+            shutil.rmtree(cls.tmpdir, ignore_errors=True)
+            cls.tmpdir = None
+    
+    def assertAllIn(self, needles, haystack):
+        """Assert that every string in needles occurs in haystack."""
+        missing = [needle for needle in needles if needle not in haystack]
+        if missing:
+            self.fail(f"{missing!r} not found in {haystack!r}")
+    
     def test_display_welcome_blank_line_todo(self):
         """Test TODO: Add a blank line after the welcome message."""
-        captured_output = io.StringIO()
-        
-        with redirect_stdout(captured_output):
-            file_manager.display_welcome()
-        
-        output = captured_output.getvalue()
+        output = self.get_welcome_output()
         
         # Check if welcome message ends with a blank line
         # The output should end with two newlines (one from last print, one blank line)
@@ -35,48 +97,69 @@ class TestFileManagerTODOTasks(unittest.TestCase):
     
     def test_floating_point_division_todo(self):
         """Test TODO: Fix floating point division in calculate_file_size."""
-        # Create a test file with specific size for division testing
-        test_file = "division_test.txt"
-        # Create a file that's 1536 bytes (1.5 KB) to test division
-        content = "A" * 1536
+        # The shared test file is 1536 bytes (1.5 KB) to test division
+        self.mock_input.return_value = self.get_test_filename()
+        _, output = capture_output(file_manager.calculate_file_size)
         
-        try:
-            with open(test_file, 'w') as f:
-                f.write(content)
+        # Check if floating point division is used correctly
+        # For 1536 bytes, should show 1.50 KB, not 1.00 KB (which would be integer division)
+        if "1.00 KB" in output:
+            self.fail("TODO: Fix floating point division - still using integer division (//)") 
+        elif "1.50 KB" not in output:
+            # Could be that the TODO is not yet implemented
+            self.assertIn("KB", output, "File size calculation should show KB units")
+    
+    def test_calculate_file_size_single_stat(self):
+        """Test calculate_file_size looks the file up with a single os.stat call."""
+        self.mock_input.return_value = self.get_test_filename()
+        
+        with patch('os.stat', wraps=os.stat) as mock_stat:
+            _, output = capture_output(file_manager.calculate_file_size)
+        
+        self.assertIn("1536 bytes", output)
+        self.assertEqual(mock_stat.call_count, 1)
+    
+    def test_calculate_file_size_messages(self):
+        """Test calculate_file_size output for valid and invalid filenames."""
+        test_filename = self.get_test_filename()
+        cases = [
+            (test_filename, ["Size:", "bytes"]),
+            (os.path.join(self.tmpdir, "missing.txt"), ["Error", "not found"]),
+            (os.path.join(self.tmpdir, "x" * 300), ["Error", "not found"]),
+            ("bad\0name.txt", ["Error", "not found"]),
+            ("", ["Error", "No filename"]),
+            (self.tmpdir, ["Error", "not a regular file"]),
+        ]
+        
+        for filename, expected in cases:
+            with self.subTest(filename=filename):
+                self.mock_input.return_value = filename
+                _, output = capture_output(file_manager.calculate_file_size)
+                self.assertAllIn(expected, output)
+        
+        # A self-referencing symlink, created in its own directory so the
+        # shared test directory is left untouched
+        with self.subTest(filename="symlink loop"):
+            loop_dir = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, loop_dir, ignore_errors=True)
+            loop_filename = os.path.join(loop_dir, "loop")
+            try:
+                os.symlink(loop_filename, loop_filename)
+            except (AttributeError, NotImplementedError, OSError) as e:
+                self.skipTest(f"cannot create symlinks here: {e}")
             
-            with patch('builtins.input', return_value=test_file):
-                captured_output = io.StringIO()
-                
-                with redirect_stdout(captured_output):
-                    file_manager.calculate_file_size()
-                
-                output = captured_output.getvalue()
-                
-                # Check if floating point division is used correctly
-                # For 1536 bytes, should show 1.50 KB, not 1.00 KB (which would be integer division)
-                if "1.50 KB" in output:
-                    self.assertTrue(True, "Floating point division is working correctly")
-                elif "1.00 KB" in output:
-                    self.fail("TODO: Fix floating point division - still using integer division (//)") 
-                else:
-                    # Could be that the TODO is not yet implemented
-                    self.assertIn("KB", output, "File size calculation should show KB units")
-                    
-        finally:
-            if os.path.exists(test_file):
-                os.remove(test_file)
+            self.mock_input.return_value = loop_filename
+            _, output = capture_output(file_manager.calculate_file_size)
+            self.assertAllIn(["Error", "not found"], output)
     
     def test_get_user_choice_return_todo(self):
         """Test TODO: Add code to return the choice."""
-        with patch('builtins.input', return_value='help'):
-            captured_output = io.StringIO()
-            
-            with redirect_stdout(captured_output):
-                choice = file_manager.get_user_choice()
-            
-            # Check that function actually returns the choice (not None)
-            self.assertIsNotNone(choice, "TODO: get_user_choice should return the choice")
-            self.assertEqual(choice, 'help', "TODO: get_user_choice should return the correct choice")
+        self.mock_input.return_value = 'help'
+        choice, _ = capture_output(file_manager.get_user_choice)
+        
+        # Check that function actually returns the choice (not None)
+        self.assertIsNotNone(choice, "TODO: get_user_choice should return the choice")
+        self.assertEqual(choice, 'help', "TODO: get_user_choice should return the correct choice")
     
     def test_process_user_command_keyword_arguments_todo(self):
         """Test TODO: Set keyword arguments with default values."""
@@ -93,38 +176,31 @@ class TestFileManagerTODOTasks(unittest.TestCase):
     
     def test_process_user_command_custom_keyword_args(self):
         """Test process_user_command with custom keyword arguments."""
-        captured_output = io.StringIO()
-        
-        with redirect_stdout(captured_output):
-            # Test with custom goodbye message
-            result = file_manager.process_user_command(
-                "quit", True, 
-                show_goodbye=True, 
-                goodbye_message="Custom goodbye!",
-                invalid_choice_prefix="Oops:",
-                valid_commands="test commands"
-            )
+        # Test with custom goodbye message
+        result, output = capture_output(
+            file_manager.process_user_command,
+            "quit", True, 
+            show_goodbye=True, 
+            goodbye_message="Custom goodbye!",
+            invalid_choice_prefix="Oops:",
+            valid_commands="test commands"
+        )
         
-        output = captured_output.getvalue()
         self.assertIn("Custom goodbye!", output)
         self.assertFalse(result, "Should return False when quit is chosen")
     
     def test_process_user_command_invalid_choice_custom_message(self):
         """Test process_user_command with custom invalid choice message."""
-        captured_output = io.StringIO()
+        result, output = capture_output(
+            file_manager.process_user_command,
+            "invalid", True,
+            show_goodbye=True,
+            goodbye_message="Bye!",
+            invalid_choice_prefix="Custom error:",
+            valid_commands="custom, commands"
+        )
         
-        with redirect_stdout(captured_output):
-            result = file_manager.process_user_command(
-                "invalid", True,
-                show_goodbye=True,
-                goodbye_message="Bye!",
-                invalid_choice_prefix="Custom error:",
-                valid_commands="custom, commands"
-            )
-        
-        output = captured_output.getvalue()
-        self.assertIn("Custom error:", output)
-        self.assertIn("custom, commands", output)
+        self.assertAllIn(["Custom error:", "custom, commands"], output)
         self.assertTrue(result, "Should return True for non-quit commands")
     
     @patch.object(file_manager, 'display_welcome')
@@ -150,8 +226,6 @@ class TestFileManagerTODOTasks(unittest.TestCase):
                 with patch.object(file_manager, 'display_welcome'):
                     try:
                         file_manager.main()
-                        # If we get here, the running variable was properly initialized
-                        self.assertTrue(True, "Running variable is properly initialized")
                     except NameError as e:
                         if "running" in str(e):
                             self.fail("TODO: Initialize running variable in main function")
@@ -170,36 +244,21 @@ class TestFileManagerTODOTasks(unittest.TestCase):
         }
         
         # Test 1: Welcome blank line
-        captured_output = io.StringIO()
-        with redirect_stdout(captured_output):
-            file_manager.display_welcome()
-        if captured_output.getvalue().endswith('\n\n'):
+        if self.get_welcome_output().endswith('\n\n'):
             todo_status["display_welcome_blank_line"] = True
         
         # Test 2: Return statement in get_user_choice
-        with patch('builtins.input', return_value='test'):
-            captured_output = io.StringIO()
-            with redirect_stdout(captured_output):
-                result = file_manager.get_user_choice()
-            if result is not None:
-                todo_status["get_user_choice_return"] = True
+        self.mock_input.return_value = 'test'
+        result, _ = capture_output(file_manager.get_user_choice)
+        if result is not None:
+            todo_status["get_user_choice_return"] = True
         
         # Test 3: Floating point division
-        test_file = "float_test.txt"
-        try:
-            with open(test_file, 'w') as f:
-                f.write("A" * 1536)  # 1.5 KB
-            
-            with patch('builtins.input', return_value=test_file):
-                captured_output = io.StringIO()
-                with redirect_stdout(captured_output):
-                    file_manager.calculate_file_size()
-                
-                if "1.50 KB" in captured_output.getvalue():
-                    todo_status["floating_point_division"] = True
-        finally:
-            if os.path.exists(test_file):
-                os.remove(test_file)
+        self.mock_input.return_value = self.get_test_filename()
+        _, output = capture_output(file_manager.calculate_file_size)
+        
+        if "1.50 KB" in output:
+            todo_status["floating_point_division"] = True
         
         # Test 4: Default arguments in process_user_command
         try:
@@ -280,10 +339,6 @@ class TestFileManagerTODOTasks(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Create a test suite and run all TODO tests
-    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+    # Run all TODO tests; command line arguments such as -f (stop on first
+    # failure), -k PATTERN or a test name select what runs
+    unittest.main(verbosity=2)